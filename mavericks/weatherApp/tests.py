@@ -1,3 +1,74 @@
-from django.test import TestCase
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+
+from . import views
+
+HOURLY_FORECAST = [
+    {'time': '07:00 AM - 08:00 AM', 'temperature': 24.1, 'chance_of_rain': 10, 'wind_speed': 6.5, 'uv_index': 3},
+]
+TIME_INTERVALS = ['07:00 AM - 08:00 AM']
+
+
+class ForecastApiTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        patcher = mock.patch.object(views, 'fetch_weather_data', return_value=(HOURLY_FORECAST, TIME_INTERVALS))
+        self.fetch_weather_data = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get(self, **headers):
+        return views.forecast_api(self.factory.get('/api/forecast/', **headers))
+
+    def expire_snapshot(self):
+        cache.delete('forecast_snapshot_Coimbatore')
+
+    def test_first_get_returns_payload_with_validators(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+        self.assertEqual(response.json(), {'hourly_forecast': HOURLY_FORECAST, 'time_intervals': TIME_INTERVALS})
+        self.fetch_weather_data.assert_called_once()
+
+    def test_matching_if_none_match_returns_304(self):
+        etag = self.get()['ETag']
+
+        response = self.get(HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+        self.fetch_weather_data.assert_called_once()
+
+    def test_head_is_allowed(self):
+        response = views.forecast_api(self.factory.head('/api/forecast/'))
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_last_modified_only_moves_when_data_changes(self):
+        first_time = datetime(2024, 10, 17, 8, 0, tzinfo=dt_timezone.utc)
+        later_time = datetime(2024, 10, 17, 9, 0, tzinfo=dt_timezone.utc)
+
+        with mock.patch.object(views.timezone, 'now', return_value=first_time):
+            first = self.get()
+
+        # Refetch with identical data: same ETag and Last-Modified
+        self.expire_snapshot()
+        with mock.patch.object(views.timezone, 'now', return_value=later_time):
+            unchanged = self.get()
+        self.assertEqual(unchanged['ETag'], first['ETag'])
+        self.assertEqual(unchanged['Last-Modified'], first['Last-Modified'])
+
+        # Refetch with new data: new ETag and a newer Last-Modified
+        self.expire_snapshot()
+        changed_forecast = [dict(HOURLY_FORECAST[0], temperature=26.3)]
+        self.fetch_weather_data.return_value = (changed_forecast, TIME_INTERVALS)
+        with mock.patch.object(views.timezone, 'now', return_value=later_time):
+            changed = self.get()
+        self.assertNotEqual(changed['ETag'], first['ETag'])
+        self.assertNotEqual(changed['Last-Modified'], first['Last-Modified'])
+        self.assertEqual(views.get_forecast_snapshot()['last_modified'], later_time)
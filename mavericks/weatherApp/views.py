@@ -2,9 +2,17 @@ from django.shortcuts import render,redirect
 from django.contrib.auth import login, authenticate,logout
 from django.contrib import messages
 from django.contrib.auth.forms import AuthenticationForm
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_safe
 from .forms import NewUserForm
 from .models import WeatherData, BusinessData, RiskAssessment
 import requests,pandas as pd
+import hashlib, json
 from datetime import datetime, timedelta
 
 
@@ -184,6 +192,48 @@ def fetch_weather_data(city="Coimbatore"):
 
     return hourly_forecast, timeIntervals
 
+# How long a fetched forecast is reused before calling the weather API again
+FORECAST_CACHE_TIMEOUT = 600
+
+def get_forecast_snapshot(city="Coimbatore"):
+    snapshot_key = f'forecast_snapshot_{city}'
+    snapshot = cache.get(snapshot_key)
+    if snapshot is None:
+        hourly_forecast, time_intervals = fetch_weather_data(city)
+        payload = {
+            'hourly_forecast': hourly_forecast,
+            'time_intervals': time_intervals,
+        }
+        etag = hashlib.sha1(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+        # Keep the previous Last-Modified when a refetch returns identical data
+        previous = cache.get(f'forecast_version_{city}')
+        if previous and previous['etag'] == etag:
+            last_modified = previous['last_modified']
+        else:
+            last_modified = timezone.now().replace(microsecond=0)
+            cache.set(f'forecast_version_{city}', {'etag': etag, 'last_modified': last_modified}, None)
+
+        snapshot = {'payload': payload, 'etag': etag, 'last_modified': last_modified}
+        cache.set(snapshot_key, snapshot, FORECAST_CACHE_TIMEOUT)
+    return snapshot
+
+# JSON forecast API, returns 304 when the client already has the current snapshot.
+# The snapshot is read once so the validators always describe the body sent.
+@require_safe
+@cache_control(private=True, no_cache=True)
+def forecast_api(request):
+    snapshot = get_forecast_snapshot()
+    etag = quote_etag(snapshot['etag'])
+    last_modified = int(snapshot['last_modified'].timestamp())
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        response = JsonResponse(snapshot['payload'])
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
+
 # Dashboard view
 def dashboard(request):
     weather_data = WeatherData.objects.all()
@@ -191,7 +241,9 @@ def dashboard(request):
     risk_assessment = RiskAssessment.objects.all()
 
     # Fetch weather forecast and best time intervals
-    hourly_forecast, time_intervals = fetch_weather_data()
+    snapshot = get_forecast_snapshot()
+    hourly_forecast = snapshot['payload']['hourly_forecast']
+    time_intervals = snapshot['payload']['time_intervals']
 
     context = {
         'weather_data': weather_data,
@@ -199,6 +251,8 @@ def dashboard(request):
         'risk_assessment': risk_assessment,
         'hourly_forecast': hourly_forecast,  # Send hourly forecast data to the template
         'time_intervals': time_intervals,    # Best time intervals for weather conditions
+        'forecast_etag': snapshot['etag'],   # Keys the cached forecast fragment to the data
+        'forecast_cache_timeout': FORECAST_CACHE_TIMEOUT,
     }
     
     return render(request, 'weatherApp/home.html', context)
@@ -2,12 +2,32 @@ import openmeteo_requests
 import requests_cache
 import pandas as pd
 import numpy as np
+import argparse
+import os
+import tempfile
+import time
 from retry_requests import retry
 from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestRegressor
+from sklearn.ensemble import RandomForestRegressor, HistGradientBoostingRegressor
 from sklearn.metrics import mean_squared_error
 import joblib
 
+# The target (temperature_2m) is left out on purpose; its lag features carry its history
+FEATURES = ['precipitation', 'wind_speed_10m', 'wind_direction_10m',
+            'temperature_2m_max', 'temperature_2m_min', 'precipitation_hours',
+            'temperature_2m_lag_1', 'precipitation_lag_1', 'wind_speed_10m_lag_1',
+            'temperature_2m_lag_24', 'precipitation_lag_24', 'wind_speed_10m_lag_24']
+
+# Estimator backends selectable through WeatherAIModel(model_type=...).
+# "random_forest" is the original full-depth forest; the other two trade a
+# little accuracy for much smaller artifacts and faster predictions.
+MODEL_BACKENDS = {
+    "random_forest": lambda: RandomForestRegressor(n_estimators=100, random_state=42),
+    "compact_forest": lambda: RandomForestRegressor(n_estimators=50, max_depth=12, min_samples_leaf=4,
+                                                    random_state=42),
+    "hist_gradient_boosting": lambda: HistGradientBoostingRegressor(max_iter=200, random_state=42),
+}
+
 def fetch_historical_weather_data(latitude, longitude, start_date, end_date):
     """Fetch historical weather data using the Open-Meteo API."""
     cache_session = requests_cache.CachedSession('.cache', expire_after=-1)
@@ -63,10 +83,14 @@ def fetch_historical_weather_data(latitude, longitude, start_date, end_date):
     return hourly_dataframe, daily_dataframe
 
 class WeatherAIModel:
-    def __init__(self, hourly_data, daily_data):
+    def __init__(self, hourly_data, daily_data, model_type="random_forest"):
+        if model_type not in MODEL_BACKENDS:
+            raise ValueError(f"Unknown model_type '{model_type}', expected one of {sorted(MODEL_BACKENDS)}")
         self.hourly_data = hourly_data
         self.daily_data = daily_data
+        self.model_type = model_type
         self.model = None
+        self.mse = None
 
     def preprocess_data(self):
         # Convert hourly data 'date' to datetime if it's not already
@@ -89,25 +113,20 @@ class WeatherAIModel:
         self.combined_data.dropna(inplace=True)
 
     def train_model(self):
-        features = ['temperature_2m', 'precipitation', 'wind_speed_10m', 'wind_direction_10m',
-                    'temperature_2m_max', 'temperature_2m_min', 'precipitation_hours',
-                    'temperature_2m_lag_1', 'precipitation_lag_1', 'wind_speed_10m_lag_1',
-                    'temperature_2m_lag_24', 'precipitation_lag_24', 'wind_speed_10m_lag_24']
-        
         target = 'temperature_2m'
 
-        X = self.combined_data[features]
+        X = self.combined_data[FEATURES]
         y = self.combined_data[target]
 
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        X_train, self.X_test, y_train, self.y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-        self.model = RandomForestRegressor(n_estimators=100, random_state=42)
+        self.model = MODEL_BACKENDS[self.model_type]()
         self.model.fit(X_train, y_train)
 
         # Evaluate the model
-        y_pred = self.model.predict(X_test)
-        mse = mean_squared_error(y_test, y_pred)
-        print(f"Model Mean Squared Error: {mse}")
+        y_pred = self.model.predict(self.X_test)
+        self.mse = mean_squared_error(self.y_test, y_pred)
+        print(f"Model Mean Squared Error ({self.model_type}): {self.mse}")
 
     def make_predictions(self, future_data):
         return self.model.predict(future_data)
@@ -138,15 +157,80 @@ class WeatherAIModel:
                 decisions.append("No action needed")
         return decisions
 
-    def save_model(self, filename):
-        joblib.dump(self.model, filename)
+    def save_model(self, filename, compress=3):
+        # zlib level 3 by default; compare_model_backends reports raw vs compressed size and load time
+        joblib.dump(self.model, filename, compress=compress)
 
     @staticmethod
     def load_model(filename):
         return joblib.load(filename)
 
+def _median_latency(func, repeats):
+    func()  # warm-up call, not timed
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings))
+
+def compare_model_backends(hourly_data, daily_data, model_types=None, repeats=50, batch_repeats=5):
+    """Train each backend on the same split and report size, latency and MSE."""
+    results = []
+    for model_type in model_types or MODEL_BACKENDS:
+        ai_model = WeatherAIModel(hourly_data.copy(), daily_data.copy(), model_type=model_type)
+        ai_model.preprocess_data()
+        ai_model.train_model()
+
+        row = {"model_type": model_type}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for label, compress in (("raw", 0), ("compressed", 3)):
+                path = os.path.join(tmp_dir, f"{model_type}_{label}.joblib")
+                ai_model.save_model(path, compress=compress)
+                row[f"{label}_kb"] = os.path.getsize(path) / 1024
+                start = time.perf_counter()
+                model = WeatherAIModel.load_model(path)
+                row[f"{label}_load_ms"] = (time.perf_counter() - start) * 1000
+
+        single_row = ai_model.X_test.iloc[:1]
+        single_latency = _median_latency(lambda: model.predict(single_row), repeats)
+        batch_latency = _median_latency(lambda: model.predict(ai_model.X_test), batch_repeats)
+
+        row.update({
+            "single_row_ms": single_latency * 1000,
+            "batch_ms": batch_latency * 1000,
+            "batch_rows": len(ai_model.X_test),
+            "mse": ai_model.mse,
+        })
+        results.append(row)
+
+    report = pd.DataFrame(results).set_index("model_type")
+    print(report.round(3).to_string())
+    return report
+
+def select_model_backend(report, latency_budget_ms, latency_column="batch_ms"):
+    """Pick the most accurate backend whose latency fits within the budget.
+
+    Ties on MSE go to the faster backend. Returns None when nothing fits.
+    """
+    within_budget = report[report[latency_column] <= latency_budget_ms]
+    if within_budget.empty:
+        return None
+    return within_budget.sort_values(["mse", latency_column], kind="stable").index[0]
+
 # Main execution
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Train the weather AI model.")
+    parser.add_argument("--model", choices=sorted(MODEL_BACKENDS), default="random_forest",
+                        help="estimator backend to train")
+    parser.add_argument("--compare", action="store_true",
+                        help="train every backend and print a size/latency/MSE report first")
+    parser.add_argument("--latency-budget-ms", type=float,
+                        help="with --compare, train the most accurate backend within this batch latency")
+    args = parser.parse_args()
+    if args.latency_budget_ms is not None and not args.compare:
+        parser.error("--latency-budget-ms requires --compare")
+
     # Fetch historical weather data
     latitude = 11.0168  # Coimbatore, India
     longitude = 76.9558
@@ -156,8 +240,20 @@ if __name__ == "__main__":
     print("Fetching historical weather data...")
     hourly_data, daily_data = fetch_historical_weather_data(latitude, longitude, start_date, end_date)
     
+    model_type = args.model
+    if args.compare:
+        print("Comparing model backends...")
+        report = compare_model_backends(hourly_data, daily_data)
+        if args.latency_budget_ms is not None:
+            selected = select_model_backend(report, args.latency_budget_ms)
+            if selected is None:
+                print(f"No backend fits a {args.latency_budget_ms} ms budget, keeping '{model_type}'")
+            else:
+                model_type = selected
+                print(f"Selected '{model_type}' for a {args.latency_budget_ms} ms budget")
+
     print("Creating and training AI model...")
-    ai_model = WeatherAIModel(hourly_data, daily_data)
+    ai_model = WeatherAIModel(hourly_data, daily_data, model_type=model_type)
     ai_model.preprocess_data()
     ai_model.train_model()
 
@@ -0,0 +1,62 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from predictionModel import MODEL_BACKENDS, compare_model_backends, select_model_backend
+
+
+def make_weather_data(days=10):
+    rng = np.random.default_rng(0)
+    hours = days * 24
+    hourly_data = pd.DataFrame({
+        "date": pd.date_range("2023-01-01", periods=hours, freq="h", tz="UTC"),
+        "temperature_2m": 25 + 5 * np.sin(np.arange(hours) * 2 * np.pi / 24) + rng.normal(0, 0.5, hours),
+        "precipitation": rng.random(hours),
+        "rain": rng.random(hours),
+        "wind_speed_10m": rng.random(hours) * 10,
+        "wind_direction_10m": rng.random(hours) * 360,
+    })
+    daily_data = pd.DataFrame({
+        "date": pd.date_range("2023-01-01", periods=days, freq="D", tz="UTC"),
+        "temperature_2m_max": rng.normal(30, 1, days),
+        "temperature_2m_min": rng.normal(20, 1, days),
+        "precipitation_hours": rng.integers(0, 5, days).astype(float),
+    })
+    return hourly_data, daily_data
+
+
+class SelectModelBackendTests(unittest.TestCase):
+    def setUp(self):
+        self.report = pd.DataFrame(
+            {"batch_ms": [40.0, 5.0, 8.0], "mse": [0.5, 0.9, 0.7]},
+            index=pd.Index(["random_forest", "compact_forest", "hist_gradient_boosting"], name="model_type"),
+        )
+
+    def test_picks_most_accurate_within_budget(self):
+        self.assertEqual(select_model_backend(self.report, 10), "hist_gradient_boosting")
+        self.assertEqual(select_model_backend(self.report, 50), "random_forest")
+
+    def test_returns_none_when_nothing_fits(self):
+        self.assertIsNone(select_model_backend(self.report, 1))
+
+    def test_tie_on_mse_prefers_faster_backend(self):
+        self.report.loc["random_forest", "mse"] = 0.7
+        self.assertEqual(select_model_backend(self.report, 50), "hist_gradient_boosting")
+
+
+class CompareModelBackendsTests(unittest.TestCase):
+    def test_report_has_one_row_per_backend(self):
+        hourly_data, daily_data = make_weather_data()
+        report = compare_model_backends(hourly_data, daily_data, repeats=2, batch_repeats=2)
+
+        self.assertEqual(list(report.index), list(MODEL_BACKENDS))
+        self.assertEqual(report.index.name, "model_type")
+        for column in ["raw_kb", "raw_load_ms", "compressed_kb", "compressed_load_ms",
+                       "single_row_ms", "batch_ms", "batch_rows", "mse"]:
+            self.assertIn(column, report.columns)
+        self.assertTrue((report["mse"] > 0).all())
+
+
+if __name__ == "__main__":
+    unittest.main()